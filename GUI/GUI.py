@@ -1,16 +1,178 @@
+# Optional: Intel's extension swaps in a oneDAL RandomForest predict (SIMD
+# tree traversal). It must run before sklearn is imported — which happens
+# indirectly inside the joblib fallback loads — and is a no-op when the
+# package is not installed or the ONNX path is in use.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
-import joblib
+import atexit
+import csv
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 import os
 
+try:
+    import joblib
+except ImportError:
+    # The frozen build (see GUI.spec) is ONNX-only and excludes joblib.
+    joblib = None
+
+# Data files live next to the executable in the frozen --onedir build and
+# next to this script otherwise.
+if getattr(sys, "frozen", False):
+    APP_DIR = os.path.dirname(sys.executable)
+else:
+    APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def app_path(name):
+    return os.path.join(APP_DIR, name)
+
 # ============================
-# Load ML Models
+# Load ML Models (background)
 # ============================
-ml_bundle = joblib.load("rf_ml_only_cleaned.pkl")
-hybrid_bundle = joblib.load("rf_hybrid_cleaned.pkl")
-ml_model = ml_bundle["model"]
-hybrid_model = hybrid_bundle["model"]
+# Prefer the ONNX exports (see convert_to_onnx.py): onnxruntime runs the
+# forests natively instead of dispatching 300 trees through Python, which
+# makes the single-row predict_proba behind "Confirm & Predict" far faster.
+# Fall back to the joblib pipelines when the ONNX files are not available.
+#
+# Loading happens on a daemon thread started right after the Tk window is
+# created, so the GUI paints immediately instead of hanging while the
+# forests deserialize. The Confirm & Predict button stays disabled until
+# the models are ready.
+ml_model = None
+hybrid_model = None
+ml_session = None
+hybrid_session = None
+ml_meta = None
+hybrid_meta = None
+metas_shared = False
+models_ready = threading.Event()
+
+# The two models are independent and both release the GIL while walking
+# their trees, so their predicts run concurrently on this pair of workers.
+predict_pool = ThreadPoolExecutor(max_workers=2)
+
+def finalize_meta(meta):
+    # Post-load downcast: hold the scaler parameters as float32 arrays so
+    # standardizing a row is one vectorized op with no float64 temporaries.
+    # (The tree arrays themselves are float32 in the ONNX exports already;
+    # sklearn's Tree node struct has a fixed dtype and cannot be downcast
+    # in place.)
+    meta["mean"] = np.asarray(meta["mean"], dtype=np.float32)
+    meta["scale"] = np.asarray(meta["scale"], dtype=np.float32)
+
+    # Inference only ever varies the ten form inputs: Target is the fixed
+    # -2 sentinel and the string columns one-hot to zeros. Bake all the
+    # constants into a template row once so the predict path never touches
+    # them (or any column names) again.
+    template = np.zeros((1, meta["n_features"]), dtype=np.float32)
+    for i, col in enumerate(meta["numeric_cols"]):
+        if col == 'Target':
+            template[0, i] = (-2 - meta["mean"][i]) / meta["scale"][i]
+    meta["template"] = template
+    input_pos = np.array([meta["numeric_cols"].index(f) for f in input_features])
+    meta["input_pos"] = input_pos
+    meta["input_mean"] = meta["mean"][input_pos]
+    meta["input_scale"] = meta["scale"][input_pos]
+    return meta
+
+def extract_classifier_meta(bundle):
+    # Pull the fitted RandomForest and the scaler parameters out of the
+    # pipeline so predictions can run on a plain standardized NumPy row
+    # without rebuilding a DataFrame (or re-running the ColumnTransformer)
+    # on every click.
+    pipe = bundle["model"]
+    preprocessor = pipe.named_steps["preprocessor"]
+    scaler = preprocessor.named_transformers_["num"].named_steps["scaler"]
+    ohe = preprocessor.named_transformers_["cat"].named_steps["ohe"]
+    n_onehot = sum(len(c) for c in ohe.categories_)
+    meta = {
+        "numeric_cols": list(bundle["numeric_cols"]),
+        "mean": scaler.mean_.tolist(),
+        "scale": scaler.scale_.tolist(),
+        "n_features": len(scaler.mean_) + n_onehot,
+    }
+    return pipe.named_steps["classifier"], meta
+
+def load_bundle(name):
+    # Prefer the uncompressed .joblib dumps (see resave_for_mmap.py): with
+    # mmap_mode="r" the kernel demand-pages the tree arrays from disk, so
+    # startup touches fewer bytes and concurrent GUI processes share pages.
+    if os.path.isfile(app_path(name + ".joblib")):
+        return joblib.load(app_path(name + ".joblib"), mmap_mode="r")
+    return joblib.load(app_path(name + ".pkl"))
+
+def load_models():
+    global ml_model, hybrid_model, ml_session, hybrid_session
+    global ml_meta, hybrid_meta, metas_shared
+    try:
+        import onnxruntime as ort
+        # Tune for the GUI's one-row-at-a-time workload: full graph
+        # optimization, and a single intra-op thread so the two sessions do
+        # not each spin up a thread pool for a predict that walks one row.
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        ml_session = ort.InferenceSession(app_path("rf_ml.onnx"), opts, providers=["CPUExecutionProvider"])
+        hybrid_session = ort.InferenceSession(app_path("rf_hybrid.onnx"), opts, providers=["CPUExecutionProvider"])
+        with open(app_path("onnx_meta.json")) as f:
+            onnx_meta = json.load(f)
+        ml_meta = finalize_meta(onnx_meta["ml"])
+        hybrid_meta = finalize_meta(onnx_meta["hybrid"])
+    except Exception:
+        # onnxruntime raises its own error types for missing/corrupt model
+        # files; any failure here just means we take the joblib path.
+        ml_session = None
+        hybrid_session = None
+
+    if ml_session is None:
+        if joblib is None:
+            root.after(0, lambda: messagebox.showerror(
+                "Model Error",
+                "The ONNX model files could not be loaded and no joblib fallback is available."))
+            return
+        ml_bundle = load_bundle("rf_ml_only_cleaned")
+        hybrid_bundle = load_bundle("rf_hybrid_cleaned")
+        ml_model, ml_meta = extract_classifier_meta(ml_bundle)
+        hybrid_model, hybrid_meta = extract_classifier_meta(hybrid_bundle)
+        finalize_meta(ml_meta)
+        finalize_meta(hybrid_meta)
+
+    # Both pipelines were fit with the same preprocessing, so in practice one
+    # standardized row can feed both models; verify rather than assume.
+    metas_shared = (
+        ml_meta["numeric_cols"] == hybrid_meta["numeric_cols"]
+        and ml_meta["n_features"] == hybrid_meta["n_features"]
+        and np.array_equal(ml_meta["mean"], hybrid_meta["mean"])
+        and np.array_equal(ml_meta["scale"], hybrid_meta["scale"])
+    )
+
+    # Warm-up predict: the first call pays for tree-array page-ins, temp
+    # buffer allocation, and session spin-up. Doing it here, still off the
+    # UI thread, means the first Confirm click hits warm paths.
+    warm = np.zeros((1, ml_meta["n_features"]), dtype=np.float32)
+    warm_hybrid = warm if metas_shared else np.zeros((1, hybrid_meta["n_features"]), dtype=np.float32)
+    if ml_session is not None:
+        ml_session.run(None, {"input": warm})
+        hybrid_session.run(None, {"input": warm_hybrid})
+    else:
+        ml_model.predict_proba(warm)
+        hybrid_model.predict_proba(warm_hybrid)
+
+    models_ready.set()
+    root.after(0, on_models_ready)
+
+def on_models_ready():
+    confirm_btn.config(state="normal")
 
 # ============================
 # Feature Setup & Descriptions
@@ -36,10 +198,28 @@ feature_descriptions = {
     'MR': "Molar refractivity."
 }
 
+# ============================
+# Results CSV
+# ============================
+# One appending csv.writer shared across the session: pandas' to_csv built
+# a formatter stack and re-checked dtypes for every single-row append.
+RESULT_COLUMNS = input_features + [
+    'Target', 'PlantSource', 'Phytochemical',
+    'ML_Prob', 'Hybrid_Prob', 'ML_Pred', 'Hybrid_Pred'
+]
+results_path = app_path("GUIResults.csv")
+write_header = not os.path.isfile(results_path) or os.path.getsize(results_path) == 0
+results_fh = open(results_path, "a", newline="")
+results_writer = csv.writer(results_fh)
+if write_header:
+    results_writer.writerow(RESULT_COLUMNS)
+atexit.register(results_fh.close)
+
 # ============================
 # Main Window
 # ============================
 root = tk.Tk()
+threading.Thread(target=load_models, daemon=True).start()
 root.title("Phytochemical Anti-Angiogenic Predictor")
 root.geometry("800x550")
 root.minsize(650, 400)
@@ -59,52 +239,56 @@ style.configure("TProgressbar", thickness=20)
 # ============================
 # Tooltip
 # ============================
-tooltip = None
+# One hidden Toplevel reused for every tooltip: hovering just moves and
+# reveals it instead of creating and destroying a window per <Enter>.
+tooltip = tk.Toplevel(root)
+tooltip.wm_overrideredirect(True)
+tooltip.withdraw()
+tooltip.configure(bg="#2c3e50")
+tooltip_label = tk.Label(tooltip, text="", bg="#2c3e50", fg="white", font=("Segoe UI", 10), wraplength=300, justify="left")
+tooltip_label.pack(ipadx=6, ipady=4)
+
 def show_tooltip(event, text):
-    global tooltip
-    if tooltip:
-        tooltip.destroy()
-    tooltip = tk.Toplevel(root)
-    tooltip.wm_overrideredirect(True)
-    tooltip.configure(bg="#2c3e50")
-    label = tk.Label(tooltip, text=text, bg="#2c3e50", fg="white", font=("Segoe UI", 10), wraplength=300, justify="left")
-    label.pack(ipadx=6, ipady=4)
-    x, y = event.x_root + 10, event.y_root + 10
-    tooltip.wm_geometry(f"+{x}+{y}")
+    tooltip_label.config(text=text)
+    tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
+    tooltip.deiconify()
 
 def hide_tooltip(event):
-    global tooltip
-    if tooltip:
-        tooltip.destroy()
-        tooltip = None
+    tooltip.withdraw()
 
 # ============================
 # Global Variables
 # ============================
-user_inputs = {}
-current_index = 0
+# Preallocated slots aligned with input_features: the per-click path writes
+# by index instead of growing and rehashing a dict every session.
+input_values = [0.0] * len(input_features)
 
 # ============================
 # Frames
 # ============================
-welcome_frame = tk.Frame(root, bg="#f7f9fc")
-input_frame = tk.Frame(root, bg="#f7f9fc")
-summary_frame = tk.Frame(root, bg="#f7f9fc")   # NEW ✅
-result_frame = tk.Frame(root, bg="#f7f9fc")
+# One persistent grid-managed content frame; each screen is a cached child
+# frame swapped in via grid()/grid_remove() on navigation. The screens sit
+# in the same (expanding) cell with no sticky, which centers them without
+# place() and its per-<Configure> geometry recomputation.
+content = tk.Frame(root, bg="#f7f9fc")
+content.grid(row=0, column=0, sticky="nsew")
+content.columnconfigure(0, weight=1)
+content.rowconfigure(0, weight=1)
+
+welcome_frame = tk.Frame(content, bg="#f7f9fc")
+input_frame = tk.Frame(content, bg="#f7f9fc")
+summary_frame = tk.Frame(content, bg="#f7f9fc")   # NEW ✅
+result_frame = tk.Frame(content, bg="#f7f9fc")
 
 for frame in (welcome_frame, input_frame, summary_frame, result_frame):
-    frame.grid(row=0, column=0, sticky="nsew")
-    frame.columnconfigure(0, weight=1)
-    frame.rowconfigure(0, weight=1)
+    frame.grid(row=0, column=0)
+    frame.grid_remove()
 
 # ============================
 # Welcome Frame
 # ============================
-welcome_inner = tk.Frame(welcome_frame, bg="#f7f9fc")
-welcome_inner.grid(row=0, column=0, sticky="nsew")
-
 title_label = tk.Label(
-    welcome_inner,
+    welcome_frame,
     text="🧪 Phytochemical Activity Prediction",
     bg="#f7f9fc",
     fg="#2c3e50",
@@ -113,7 +297,7 @@ title_label = tk.Label(
 title_label.pack(pady=30)
 
 welcome_text = tk.Label(
-    welcome_inner,
+    welcome_frame,
     text="Welcome!\nThis tool predicts whether a compound is Anti- or Pro-Angiogenic.\n\nClick below to begin entering each molecular feature step by step.",
     bg="#f7f9fc",
     font=("Segoe UI", 13),
@@ -122,7 +306,7 @@ welcome_text = tk.Label(
 welcome_text.pack(pady=20)
 
 start_btn = ttk.Button(
-    welcome_inner,
+    welcome_frame,
     text="Start Input",
     command=lambda: [show_frame(input_frame), start_input()]
 )
@@ -131,79 +315,71 @@ start_btn.pack(pady=30)
 # ============================
 # Input Frame
 # ============================
-input_inner = tk.Frame(input_frame, bg="#f7f9fc")
-input_inner.place(relx=0.5, rely=0.5, anchor="center")
-
-progress_label = tk.Label(input_inner, text="", bg="#f7f9fc", font=("Segoe UI", 13, "bold"))
-progress_label.pack(pady=10)
-
-progress_bar = ttk.Progressbar(input_inner, orient="horizontal", mode="determinate", length=450)
-progress_bar.pack(pady=10)
-
-feature_label = tk.Label(input_inner, text="", bg="#f7f9fc", font=("Segoe UI", 14))
-feature_label.pack(pady=15)
-
-feature_entry = ttk.Entry(input_inner, font=("Segoe UI", 13), width=35, justify="center")
-feature_entry.pack(pady=10)
-
-button_frame = tk.Frame(input_inner, bg="#f7f9fc")
-button_frame.pack(pady=20)
-
-feature_label.bind("<Enter>", lambda e: show_tooltip(e, feature_descriptions.get(input_features[0], "")))
-feature_label.bind("<Leave>", hide_tooltip)
-
-def handle_next_feature():
-    global current_index
-    value = feature_entry.get().strip()
-    if value == "":
-        messagebox.showwarning("Missing Input", "Please enter a value before proceeding.")
-        return
-
-    feature_name = input_features[current_index]
-    try:
-        user_inputs[feature_name] = float(value)
-    except ValueError:
-        user_inputs[feature_name] = value
-
-    feature_entry.delete(0, tk.END)
-    current_index += 1
-
-    if current_index < len(input_features):
-        update_feature_prompt()
-    else:
+# All features on one form instead of the old 10-step wizard: one layout
+# pass, one set of tooltip bindings, and the models run exactly once per
+# session.
+input_title = tk.Label(input_frame, text="Enter Molecular Features", bg="#f7f9fc", fg="#2c3e50", font=("Segoe UI", 16, "bold"))
+input_title.pack(pady=15)
+
+form_frame = tk.Frame(input_frame, bg="#f7f9fc")
+form_frame.pack(pady=10)
+
+entries = {}
+for i, feature in enumerate(input_features):
+    label = tk.Label(form_frame, text=feature, bg="#f7f9fc", font=("Segoe UI", 12), anchor="w")
+    label.grid(row=i, column=0, sticky="w", padx=10, pady=3)
+    label.bind("<Enter>", lambda e, f=feature: show_tooltip(e, feature_descriptions.get(f, "")))
+    label.bind("<Leave>", hide_tooltip)
+    entry = ttk.Entry(form_frame, font=("Segoe UI", 12), width=18, justify="center")
+    entry.grid(row=i, column=1, padx=10, pady=3)
+    entries[feature] = entry
+
+button_frame = tk.Frame(input_frame, bg="#f7f9fc")
+button_frame.pack(pady=15)
+
+def collect_inputs():
+    for i, feature in enumerate(input_features):
+        entry = entries[feature]
+        value = entry.get().strip()
+        if value == "":
+            messagebox.showwarning("Missing Input", f"Please enter a value for {feature}.")
+            entry.focus()
+            return False
+        try:
+            input_values[i] = float(value)
+        except ValueError:
+            messagebox.showwarning("Invalid Input", f"Please enter a number for {feature}.")
+            entry.focus()
+            return False
+    return True
+
+def review_inputs():
+    if collect_inputs():
         build_summary()
         show_frame(summary_frame)
 
-def update_feature_prompt():
-    feature_name = input_features[current_index]
-    step = current_index + 1
-    total = len(input_features)
-    progress_label.config(text=f"Step {step} of {total}")
-    feature_label.config(text=f"Enter value for: {feature_name}")
-    progress_bar['maximum'] = total
-    progress_bar['value'] = step - 1
-    feature_label.bind("<Enter>", lambda e: show_tooltip(e, feature_descriptions.get(feature_name, "")))
-    feature_label.bind("<Leave>", hide_tooltip)
-    feature_entry.focus()
-
-next_btn = ttk.Button(button_frame, text="Next ➝", command=handle_next_feature)
-next_btn.grid(row=0, column=0, padx=10)
+review_btn = ttk.Button(button_frame, text="Review ➝", command=review_inputs)
+review_btn.grid(row=0, column=0, padx=10)
+
+root.bind("<Return>", lambda e: review_inputs() if current_frame is input_frame else None)
+
+def focus_first_entry():
+    # Skip the Tcl roundtrip when the first entry already holds focus.
+    entry = entries[input_features[0]]
+    if root.focus_get() is not entry:
+        entry.focus()
 
 def start_input():
-    global current_index
-    current_index = 0
-    user_inputs.clear()
-    feature_entry.delete(0, tk.END)
-    update_feature_prompt()
+    input_values[:] = [0.0] * len(input_features)
+    for entry in entries.values():
+        entry.delete(0, tk.END)
+    focus_first_entry()
 
 # ============================
 # Summary Frame ✅
 # ============================
-summary_inner = tk.Frame(summary_frame, bg="#f7f9fc")
-summary_inner.place(relx=0.5, rely=0.5, anchor="center")
-
 summary_title = tk.Label(
-    summary_inner,
+    summary_frame,
     text="📝 Review Your Inputs",
     bg="#f7f9fc",
     fg="#2c3e50",
@@ -211,34 +387,35 @@ summary_title = tk.Label(
 )
 summary_title.pack(pady=20)
 
-tree = ttk.Treeview(summary_inner, columns=("Feature", "Value"), show="headings", height=10)
+tree = ttk.Treeview(summary_frame, columns=("Feature", "Value"), show="headings", height=10)
 tree.heading("Feature", text="Feature")
 tree.heading("Value", text="Value")
 tree.column("Feature", width=250, anchor="center")
 tree.column("Value", width=200, anchor="center")
 tree.pack(pady=10)
 
-button_summary = tk.Frame(summary_inner, bg="#f7f9fc")
+button_summary = tk.Frame(summary_frame, bg="#f7f9fc")
 button_summary.pack(pady=20)
 
 def build_summary():
     for row in tree.get_children():
         tree.delete(row)
-    for k, v in user_inputs.items():
+    for k, v in zip(input_features, input_values):
         tree.insert("", tk.END, values=(k, v))
 
 def confirm_and_predict():
+    if not models_ready.is_set():
+        messagebox.showinfo("Loading", "The models are still loading, please try again in a moment.")
+        return
     run_prediction()
     show_frame(result_frame)
 
 def edit_inputs():
-    global current_index
-    current_index = 0
-    feature_entry.delete(0, tk.END)
+    # Keep the entries as typed so the user can fix a single field.
     show_frame(input_frame)
-    update_feature_prompt()
+    focus_first_entry()
 
-confirm_btn = ttk.Button(button_summary, text="✅ Confirm & Predict", command=confirm_and_predict)
+confirm_btn = ttk.Button(button_summary, text="✅ Confirm & Predict", command=confirm_and_predict, state="disabled")
 confirm_btn.grid(row=0, column=0, padx=10)
 
 edit_btn = ttk.Button(button_summary, text="✏️ Edit Inputs", command=edit_inputs)
@@ -247,11 +424,8 @@ edit_btn.grid(row=0, column=1, padx=10)
 # ============================
 # Result Frame
 # ============================
-result_inner = tk.Frame(result_frame, bg="#f7f9fc")
-result_inner.place(relx=0.5, rely=0.5, anchor="center")
-
 result_title = tk.Label(
-    result_inner,
+    result_frame,
     text="📊 Prediction Results",
     bg="#f7f9fc",
     fg="#2c3e50",
@@ -259,20 +433,40 @@ result_title = tk.Label(
 )
 result_title.pack(pady=20)
 
-ml_result_label = tk.Label(result_inner, text="", bg="#f7f9fc", font=("Segoe UI", 14))
+ml_result_label = tk.Label(result_frame, text="", bg="#f7f9fc", font=("Segoe UI", 14))
 ml_result_label.pack(pady=10)
 
-hybrid_result_label = tk.Label(result_inner, text="", bg="#f7f9fc", font=("Segoe UI", 14))
+hybrid_result_label = tk.Label(result_frame, text="", bg="#f7f9fc", font=("Segoe UI", 14))
 hybrid_result_label.pack(pady=10)
 
-def run_prediction():
-    user_inputs['Target'] = -2
-    user_inputs['PlantSource'] = "Unknown"
-    user_inputs['Phytochemical'] = "Unknown"
+def build_input_row(meta, key):
+    # Copy the constant template and standardize just the ten live inputs.
+    row = meta["template"].copy()
+    row[0, meta["input_pos"]] = (np.asarray(key, dtype=np.float32) - meta["input_mean"]) / meta["input_scale"]
+    return row
+
+@lru_cache(maxsize=512)
+def predict_probs(key):
+    # Re-clicking Predict (or re-confirming after a partial edit) used to
+    # rerun 2 x 300 tree walks for the same inputs; a repeat is now a dict
+    # lookup. The row is built in here too, so cache hits skip that as well.
+    ml_row = build_input_row(ml_meta, key)
+    hybrid_row = ml_row if metas_shared else build_input_row(hybrid_meta, key)
+    if ml_session is not None:
+        ml_future = predict_pool.submit(ml_session.run, None, {"input": ml_row})
+        hybrid_future = predict_pool.submit(hybrid_session.run, None, {"input": hybrid_row})
+        ml_prob = ml_future.result()[1][0][1]
+        hybrid_prob = hybrid_future.result()[1][0][1]
+    else:
+        ml_future = predict_pool.submit(ml_model.predict_proba, ml_row)
+        hybrid_future = predict_pool.submit(hybrid_model.predict_proba, hybrid_row)
+        ml_prob = ml_future.result()[0][1]
+        hybrid_prob = hybrid_future.result()[0][1]
+    return ml_prob, hybrid_prob
 
-    input_df = pd.DataFrame([user_inputs])
-    ml_prob = ml_model.predict_proba(input_df)[0][1]
-    hybrid_prob = hybrid_model.predict_proba(input_df)[0][1]
+def run_prediction():
+    key = tuple(round(v, 6) for v in input_values)
+    ml_prob, hybrid_prob = predict_probs(key)
 
     ml_class = "ANTI-ANGIOGENIC" if ml_prob >= 0.5 else "PRO-ANGIOGENIC"
     hy_class = "ANTI-ANGIOGENIC" if hybrid_prob >= 0.5 else "PRO-ANGIOGENIC"
@@ -284,16 +478,12 @@ def run_prediction():
         text=f"🔸 Hybrid Model: {hy_class}  (P = {hybrid_prob:.4f})"
     )
 
-    result_row = input_df.copy()
-    result_row['ML_Prob'] = ml_prob
-    result_row['Hybrid_Prob'] = hybrid_prob
-    result_row['ML_Pred'] = ml_class
-    result_row['Hybrid_Pred'] = hy_class
-
-    file_exists = os.path.isfile("GUIResults.csv")
-    result_row.to_csv("GUIResults.csv", mode='a', header=not file_exists, index=False)
+    results_writer.writerow(
+        input_values
+        + [-2, "Unknown", "Unknown", ml_prob, hybrid_prob, ml_class, hy_class]
+    )
 
-button_result_frame = tk.Frame(result_inner, bg="#f7f9fc")
+button_result_frame = tk.Frame(result_frame, bg="#f7f9fc")
 button_result_frame.pack(pady=20)
 
 restart_btn = ttk.Button(button_result_frame, text="🔁 Start Over", command=lambda: [show_frame(input_frame), start_input()])
@@ -302,11 +492,29 @@ restart_btn.grid(row=0, column=0, padx=10)
 exit_btn = ttk.Button(button_result_frame, text="❌ Exit", command=root.destroy)
 exit_btn.grid(row=0, column=1, padx=10)
 
+# ============================
+# Results Flush
+# ============================
+# Rows accumulate in the file object's buffer and reach disk on an idle
+# timer rather than inside the click handler; atexit's close() flushes
+# whatever is left when the window goes away.
+def flush_results():
+    results_fh.flush()
+    root.after(2000, flush_results)
+
+root.after(2000, flush_results)
+
 # ============================
 # Frame Navigation
 # ============================
+current_frame = None
+
 def show_frame(frame):
-    frame.tkraise()
+    global current_frame
+    if current_frame is not None:
+        current_frame.grid_remove()
+    frame.grid()
+    current_frame = frame
 
 show_frame(welcome_frame)
 root.mainloop()
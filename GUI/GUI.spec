@@ -0,0 +1,42 @@
+# -*- mode: python ; coding: utf-8 -*-
+# ============================
+# PyInstaller spec for the frozen GUI build
+# ============================
+# Builds a --onedir distribution that only carries the inference runtime:
+# tkinter, numpy, and onnxruntime. The training-side stack (pandas,
+# sklearn, joblib, scipy) is excluded — GUI.py degrades gracefully when
+# joblib is absent — which keeps the folder small and the cold start fast.
+# The ONNX models and scaler metadata ship next to the executable, where
+# app_path() in GUI.py looks for them.
+#
+# Build with:  pyinstaller GUI.spec
+
+a = Analysis(
+    ['GUI.py'],
+    datas=[
+        ('rf_ml.onnx', '.'),
+        ('rf_hybrid.onnx', '.'),
+        ('onnx_meta.json', '.'),
+    ],
+    excludes=[
+        'pandas', 'sklearn', 'sklearnex', 'joblib', 'scipy',
+        'matplotlib', 'PIL', 'IPython',
+    ],
+)
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    exclude_binaries=True,
+    name='PhytoChemPredictor',
+    console=False,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    name='PhytoChemPredictor',
+)
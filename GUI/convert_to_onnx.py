@@ -0,0 +1,92 @@
+# ============================
+# One-shot ONNX conversion for the GUI models
+# ============================
+# Converts the RandomForest classifiers inside the two cleaned bundles to
+# ONNX so the GUI can run them through onnxruntime instead of sklearn's
+# per-tree Python dispatch (much lower latency for 1-row predict_proba).
+#
+# The GUI always submits PlantSource/Phytochemical as "Unknown", which the
+# fitted OneHotEncoder (handle_unknown='ignore') maps to an all-zero block.
+# So we export only the classifier and keep the string columns out of the
+# ONNX graph: the GUI standardizes the numeric features with the scaler
+# parameters saved in onnx_meta.json and pads the one-hot block with zeros.
+#
+# Run once after (re)training:  python convert_to_onnx.py
+
+import json
+import joblib
+import numpy as np
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+BUNDLES = {
+    "ml": ("rf_ml_only_cleaned.pkl", "rf_ml.onnx"),
+    "hybrid": ("rf_hybrid_cleaned.pkl", "rf_hybrid.onnx"),
+}
+
+
+def convert_bundle(pkl_path, onnx_path):
+    bundle = joblib.load(pkl_path)
+    pipe = bundle["model"]
+    preprocessor = pipe.named_steps["preprocessor"]
+    classifier = pipe.named_steps["classifier"]
+
+    num_pipe = preprocessor.named_transformers_["num"]
+    scaler = num_pipe.named_steps["scaler"]
+    cat_pipe = preprocessor.named_transformers_["cat"]
+    ohe = cat_pipe.named_steps["ohe"]
+    n_onehot = sum(len(c) for c in ohe.categories_)
+    n_features = len(scaler.mean_) + n_onehot
+
+    onx = convert_sklearn(
+        classifier,
+        initial_types=[("input", FloatTensorType([None, n_features]))],
+        options={id(classifier): {"zipmap": False}},
+    )
+    with open(onnx_path, "wb") as f:
+        f.write(onx.SerializeToString())
+
+    meta = {
+        "numeric_cols": list(bundle["numeric_cols"]),
+        "mean": scaler.mean_.tolist(),
+        "scale": scaler.scale_.tolist(),
+        "n_features": n_features,
+    }
+    print(f"{pkl_path} -> {onnx_path}  ({n_features} features, "
+          f"{classifier.n_estimators} trees)")
+    return bundle, meta
+
+
+def check_parity(bundle, meta, onnx_path):
+    # Sanity check: ONNX must reproduce the sklearn pipeline probabilities
+    # for the kind of row the GUI submits (strings fixed to "Unknown").
+    import pandas as pd
+    import onnxruntime as ort
+
+    sample = {
+        'PlantSource': "Unknown", 'Phytochemical': "Unknown", 'Target': -2,
+        'DockingScorekcalmol': -7.5,
+        'ADMETHighlights1ADMETpasses0ADMETnotpasses': 1,
+        'MWgmol': 300.0, 'LogP': 2.5, 'TPSA': 60.0, 'HBD': 2, 'HBA': 4,
+        'RotB': 3, 'AromaticRings': 2, 'MR': 80.0
+    }
+    expected = bundle["model"].predict_proba(pd.DataFrame([sample]))[0][1]
+
+    row = np.zeros((1, meta["n_features"]), dtype=np.float32)
+    for i, col in enumerate(meta["numeric_cols"]):
+        row[0, i] = (sample[col] - meta["mean"][i]) / meta["scale"][i]
+    sess = ort.InferenceSession(onnx_path, providers=["CPUExecutionProvider"])
+    got = sess.run(None, {"input": row})[1][0][1]
+    print(f"  parity: sklearn={expected:.6f}  onnx={got:.6f}")
+    assert abs(expected - got) < 1e-4, "ONNX output diverges from sklearn"
+
+
+if __name__ == "__main__":
+    all_meta = {}
+    for name, (pkl_path, onnx_path) in BUNDLES.items():
+        bundle, meta = convert_bundle(pkl_path, onnx_path)
+        check_parity(bundle, meta, onnx_path)
+        all_meta[name] = meta
+    with open("onnx_meta.json", "w") as f:
+        json.dump(all_meta, f, indent=2)
+    print("Wrote onnx_meta.json")
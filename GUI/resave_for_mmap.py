@@ -0,0 +1,28 @@
+# ============================
+# One-shot re-save of the model bundles for memory-mapped loading
+# ============================
+# The .pkl bundles are read entirely into the heap by joblib.load, so every
+# GUI instance pays the full read and keeps a private copy of all the tree
+# arrays. Re-dumping them uncompressed lets joblib.load(..., mmap_mode="r")
+# demand-page the NumPy arrays straight from disk: startup touches far fewer
+# bytes and concurrent GUI processes share the pages. Compression must stay
+# off — compressed dumps cannot be memory-mapped.
+#
+# Run once after (re)training:  python resave_for_mmap.py
+
+import joblib
+
+BUNDLES = {
+    "rf_ml_only_cleaned.pkl": "rf_ml_only_cleaned.joblib",
+    "rf_hybrid_cleaned.pkl": "rf_hybrid_cleaned.joblib",
+}
+
+if __name__ == "__main__":
+    for pkl_path, joblib_path in BUNDLES.items():
+        bundle = joblib.load(pkl_path)
+        joblib.dump(bundle, joblib_path, compress=0)
+        # Confirm the mmap path is live: mapped arrays have a file-backed base.
+        reloaded = joblib.load(joblib_path, mmap_mode="r")
+        tree = reloaded["model"].named_steps["classifier"].estimators_[0].tree_
+        mapped = tree.threshold.base is not None
+        print(f"{pkl_path} -> {joblib_path}  (mmap {'OK' if mapped else 'NOT active'})")